@@ -5,7 +5,12 @@
       # For formatting
       black
 
+      orjson
       requests
+
+      # Optional, for AsyncOllama and Ollama(http2=True)
+      h2
+      httpx
     ];
   python = pkgs.python3.withPackages deps; # Python3.11 as of writing
 in
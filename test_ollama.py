@@ -0,0 +1,277 @@
+import asyncio
+import hashlib
+import http.server
+import os
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+from ollama import AsyncOllama, Ollama
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+
+class _FlakyHandler(http.server.BaseHTTPRequestHandler):
+    """
+    Answers the first request to each path with a configured error status,
+    then succeeds, recording every request body it received.
+    """
+
+    protocol_version = "HTTP/1.1"
+    first_status = 503
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        attempts = self.server.attempts.setdefault(self.path, [])
+        attempts.append(body)
+        status = self.first_status if len(attempts) == 1 else 201
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class RetryTest(unittest.TestCase):
+    def start_server(self, first_status):
+        handler = type("Handler", (_FlakyHandler,), {"first_status": first_status})
+        server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        server.attempts = {}
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        client = Ollama(f"http://127.0.0.1:{server.server_address[1]}", timeout=5)
+        self.addCleanup(client.close)
+        return server, client
+
+    def test_create_blob_is_resent_in_full_after_503(self):
+        server, client = self.start_server(503)
+        content = os.urandom(300_000)
+        digest = f"sha256:{hashlib.sha256(content).hexdigest()}"
+        with tempfile.NamedTemporaryFile(delete=False) as file:
+            file.write(content)
+        self.addCleanup(os.remove, file.name)
+
+        status_code = client.create_blob(digest, file.name, sendfile=False)
+
+        self.assertEqual(status_code, 201)
+        self.assertEqual(server.attempts[f"/api/blobs/{digest}"], [content, content])
+
+    def test_create_blob_defaults_to_the_retrying_session(self):
+        server, client = self.start_server(503)
+        content = os.urandom(1000)
+        digest = f"sha256:{hashlib.sha256(content).hexdigest()}"
+        with tempfile.NamedTemporaryFile(delete=False) as file:
+            file.write(content)
+        self.addCleanup(os.remove, file.name)
+
+        self.assertEqual(client.create_blob(digest, file.name), 201)
+        self.assertEqual(len(server.attempts[f"/api/blobs/{digest}"]), 2)
+
+    def test_create_blob_with_sendfile_uploads_in_one_attempt(self):
+        server, client = self.start_server(201)
+        content = os.urandom(300_000)
+        digest = f"sha256:{hashlib.sha256(content).hexdigest()}"
+        with tempfile.NamedTemporaryFile(delete=False) as file:
+            file.write(content)
+        self.addCleanup(os.remove, file.name)
+
+        with mock.patch.object(
+            client, "_sendfile_request", wraps=client._sendfile_request
+        ) as sendfile_request:
+            status_code = client.create_blob(digest, file.name, sendfile=True)
+
+        sendfile_request.assert_called_once()
+        self.assertEqual(status_code, 201)
+        self.assertEqual(server.attempts[f"/api/blobs/{digest}"], [content])
+
+    def test_post_is_not_resent_after_gateway_error(self):
+        server, client = self.start_server(502)
+
+        status_code, _ = client.copy_model("source", "destination")
+
+        self.assertEqual(status_code, 502)
+        self.assertEqual(len(server.attempts["/api/copy"]), 1)
+
+
+class _ETagHandler(http.server.BaseHTTPRequestHandler):
+    """
+    Serves /api/tags and /api/show with an ETag derived from the request,
+    answering a matching If-None-Match with 304 Not Modified.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def respond(self, body):
+        etag = f'"{hashlib.sha256(body).hexdigest()}"'
+        self.server.statuses.append(
+            304 if self.headers.get("If-None-Match") == etag else 200
+        )
+        self.send_response(self.server.statuses[-1])
+        self.send_header("ETag", etag)
+        if self.server.statuses[-1] == 304:
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self.respond(b'{"models": []}')
+
+    def do_POST(self):
+        self.respond(self.rfile.read(int(self.headers["Content-Length"])))
+
+    def log_message(self, format, *args):
+        pass
+
+
+class ETagCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _ETagHandler)
+        self.server.statuses = []
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.client = Ollama(f"http://127.0.0.1:{self.server.server_address[1]}")
+        self.addCleanup(self.client.close)
+
+    def test_not_modified_returns_cached_response(self):
+        status_code, response = self.client.list_local_models()
+        cached_status_code, cached_response = self.client.list_local_models()
+
+        self.assertEqual(self.server.statuses, [200, 304])
+        self.assertEqual((status_code, cached_status_code), (200, 200))
+        self.assertIs(cached_response, response)
+        self.assertEqual(cached_response.json(), {"models": []})
+
+    def test_cache_evicts_least_recently_used(self):
+        with mock.patch("ollama._ETAG_CACHE_SIZE", 2):
+            self.client.show_model_info("a")
+            self.client.show_model_info("b")
+            self.client.show_model_info("a")
+            self.client.show_model_info("c")
+            self.client.show_model_info("a")
+            self.client.show_model_info("b")
+
+        self.assertEqual(self.server.statuses, [200, 200, 304, 200, 304, 200])
+        self.assertEqual(len(self.client._etag_cache), 2)
+
+
+class _EchoHandler(http.server.BaseHTTPRequestHandler):
+    """
+    Records every POST body, echoing JSON back, streaming two NDJSON status
+    lines for /api/pull and accepting blobs with 201 Created.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        self.server.requests.append((self.path, self.headers["Content-Type"], body))
+        if self.path.startswith("/api/blobs/"):
+            self.send_response(201)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if self.path == "/api/pull":
+            body = b'{"status": "pulling"}\n{"status": "success"}\n'
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@unittest.skipIf(httpx is None, "httpx is not installed")
+class HTTP2SessionTest(unittest.TestCase):
+    def setUp(self):
+        try:
+            import h2  # noqa: F401
+        except ImportError:
+            self.skipTest("h2 is not installed")
+        self.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _EchoHandler)
+        self.server.requests = []
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.client = Ollama(
+            f"http://127.0.0.1:{self.server.server_address[1]}", http2=True
+        )
+        self.addCleanup(self.client.close)
+
+    def test_json_post(self):
+        status_code, response = self.client.copy_model("source", "destination")
+
+        self.assertEqual(status_code, 200)
+        self.assertEqual(
+            response.json(), {"source": "source", "destination": "destination"}
+        )
+        self.assertEqual(self.server.requests[0][:2], ("/api/copy", "application/json"))
+
+    def test_create_blob(self):
+        content = os.urandom(300_000)
+        digest = f"sha256:{hashlib.sha256(content).hexdigest()}"
+        with tempfile.NamedTemporaryFile(delete=False) as file:
+            file.write(content)
+        self.addCleanup(os.remove, file.name)
+
+        status_code = self.client.create_blob(digest, file.name, sendfile=False)
+
+        self.assertEqual(status_code, 201)
+        self.assertEqual(
+            self.server.requests,
+            [(f"/api/blobs/{digest}", "application/octet-stream", content)],
+        )
+
+    def test_streamed_pull_model(self):
+        statuses = list(self.client.pull_model("model"))
+
+        self.assertEqual(statuses, [{"status": "pulling"}, {"status": "success"}])
+        self.assertEqual(self.server.requests[0][0], "/api/pull")
+
+
+class SharedTest(unittest.TestCase):
+    def test_shared_client_is_created_once_per_class_and_url(self):
+        class Subclass(Ollama):
+            pass
+
+        base_url = "http://shared.test:11434"
+        client = Ollama.shared(base_url, pool_maxsize=8)
+
+        self.assertIs(Ollama.shared(base_url), client)
+        self.assertIs(Ollama.shared(base_url, pool_maxsize=8), client)
+        self.assertIsInstance(Subclass.shared(base_url), Subclass)
+        with self.assertRaises(ValueError):
+            Ollama.shared(base_url, pool_maxsize=16)
+
+
+@unittest.skipIf(httpx is None, "httpx is not installed")
+class AsyncOllamaTest(unittest.TestCase):
+    def test_default_timeout_bounds_connect_only(self):
+        client = AsyncOllama("http://127.0.0.1:1")
+
+        self.assertEqual(client._client.timeout, httpx.Timeout(None, connect=5))
+
+    def test_unreachable_server_fails_instead_of_hanging(self):
+        # 192.0.2.0/24 is reserved for documentation and never routed.
+        client = AsyncOllama("http://192.0.2.1:11434", timeout=(0.5, None))
+
+        async def list_models():
+            async with client:
+                await client.list_local_models()
+
+        with self.assertRaises(httpx.TransportError):
+            asyncio.run(asyncio.wait_for(list_models(), 10))
+
+
+if __name__ == "__main__":
+    unittest.main()